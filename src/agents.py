@@ -1,4 +1,5 @@
 """AI Agents for PDF extraction and comparison using Microsoft Agent Framework."""
+import asyncio
 import json
 from pathlib import Path
 from typing import Any
@@ -81,10 +82,12 @@ Be thorough and accurate - this data will be used for detailed comparison."""
         print("STEP 1: Extracting PDF Content")
         print(f"{'='*60}")
         
-        extraction1 = self.pdf_extractor.extract(pdf1_path)
+        # Both files are independent, so extract them concurrently in worker threads
+        extraction1, extraction2 = await asyncio.gather(
+            asyncio.to_thread(self.pdf_extractor.extract, pdf1_path),
+            asyncio.to_thread(self.pdf_extractor.extract, pdf2_path)
+        )
         print(f"✓ Extracted {len(extraction1.sections)} sections from {extraction1.filename}")
-        
-        extraction2 = self.pdf_extractor.extract(pdf2_path)
         print(f"✓ Extracted {len(extraction2.sections)} sections from {extraction2.filename}")
         
         # Optionally enhance the extractions with AI analysis
@@ -1,6 +1,7 @@
 """Configuration module for loading environment variables and Azure settings."""
 import os
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 
 from dotenv import load_dotenv
@@ -8,8 +9,11 @@ from dotenv import load_dotenv
 # Load environment variables from .env file
 load_dotenv()
 
+# Supported local PDF text backends
+PDF_TEXT_BACKENDS = frozenset({"pypdfium2", "pdfplumber"})
 
-@dataclass
+
+@dataclass(frozen=True)
 class AzureOpenAIConfig:
     """Azure OpenAI configuration."""
     endpoint: str
@@ -18,36 +22,44 @@ class AzureOpenAIConfig:
     api_version: str
 
 
-@dataclass
+@dataclass(frozen=True)
 class AzureDocumentIntelligenceConfig:
     """Azure Document Intelligence configuration."""
     endpoint: str
     api_key: str
 
 
-@dataclass
+@dataclass(frozen=True)
 class AppConfig:
     """Application configuration."""
     azure_openai: AzureOpenAIConfig
     azure_document_intelligence: AzureDocumentIntelligenceConfig | None
     input_folder: Path
     output_folder: Path
+    pdf_text_backend: str = "pypdfium2"
 
 
+@lru_cache(maxsize=1)
 def load_config() -> AppConfig:
     """Load application configuration from environment variables.
     
+    The result is cached for the lifetime of the process; call
+    ``load_config.cache_clear()`` to force the environment to be re-read.
+    
     Returns:
         AppConfig: Application configuration object
         
     Raises:
         ValueError: If required environment variables are missing
     """
+    # Snapshot the environment once and read every setting from it
+    env = dict(os.environ)
+    
     # Required Azure OpenAI settings
-    openai_endpoint = os.getenv("AZURE_OPENAI_ENDPOINT")
-    openai_api_key = os.getenv("AZURE_OPENAI_API_KEY")
-    openai_deployment = os.getenv("AZURE_OPENAI_DEPLOYMENT_NAME", "gpt-4o")
-    openai_api_version = os.getenv("AZURE_OPENAI_API_VERSION", "2024-08-01-preview")
+    openai_endpoint = env.get("AZURE_OPENAI_ENDPOINT")
+    openai_api_key = env.get("AZURE_OPENAI_API_KEY")
+    openai_deployment = env.get("AZURE_OPENAI_DEPLOYMENT_NAME", "gpt-4o")
+    openai_api_version = env.get("AZURE_OPENAI_API_VERSION", "2024-08-01-preview")
     
     if not openai_endpoint or not openai_api_key:
         raise ValueError(
@@ -63,8 +75,8 @@ def load_config() -> AppConfig:
     )
     
     # Optional Azure Document Intelligence settings
-    doc_intel_endpoint = os.getenv("AZURE_DOCUMENT_INTELLIGENCE_ENDPOINT")
-    doc_intel_api_key = os.getenv("AZURE_DOCUMENT_INTELLIGENCE_API_KEY")
+    doc_intel_endpoint = env.get("AZURE_DOCUMENT_INTELLIGENCE_ENDPOINT")
+    doc_intel_api_key = env.get("AZURE_DOCUMENT_INTELLIGENCE_API_KEY")
     
     azure_doc_intelligence = None
     if doc_intel_endpoint and doc_intel_api_key:
@@ -74,8 +86,17 @@ def load_config() -> AppConfig:
         )
     
     # Input/Output paths
-    input_folder = Path(os.getenv("INPUT_FOLDER", "./input"))
-    output_folder = Path(os.getenv("OUTPUT_FOLDER", "./output"))
+    input_folder = Path(env.get("INPUT_FOLDER", "./input"))
+    output_folder = Path(env.get("OUTPUT_FOLDER", "./output"))
+    
+    # Local PDF text backend ("pypdfium2" or "pdfplumber")
+    pdf_text_backend = env.get("PDF_TEXT_BACKEND", "pypdfium2").lower()
+    
+    if pdf_text_backend not in PDF_TEXT_BACKENDS:
+        raise ValueError(
+            f"Invalid PDF_TEXT_BACKEND '{pdf_text_backend}'. "
+            f"Expected one of: {', '.join(sorted(PDF_TEXT_BACKENDS))}"
+        )
     
     # Ensure output folder exists
     output_folder.mkdir(parents=True, exist_ok=True)
@@ -84,5 +105,6 @@ def load_config() -> AppConfig:
         azure_openai=azure_openai,
         azure_document_intelligence=azure_doc_intelligence,
         input_folder=input_folder,
-        output_folder=output_folder
+        output_folder=output_folder,
+        pdf_text_backend=pdf_text_backend
     )
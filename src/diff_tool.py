@@ -1,12 +1,21 @@
 """Text differencing utilities using difflib for deterministic comparison."""
 import difflib
 from dataclasses import dataclass
+from itertools import islice, pairwise
+from operator import attrgetter
 from typing import Literal
 
+from rapidfuzz.fuzz import ratio
+
 from .models import PDFExtraction, TextSection
 
+try:
+    from xxhash import xxh3_128 as _new_hasher
+except ImportError:  # Optional fast hash, blake2b is used instead
+    from hashlib import blake2b as _new_hasher
+
 
-@dataclass
+@dataclass(slots=True)
 class RawDifference:
     """Represents a raw difference found by difflib before LLM enhancement.
     
@@ -60,141 +69,167 @@ class TextDiffer:
         Returns:
             List of RawDifference objects (without LLM context)
         """
-        # Build full text documents with line tracking
-        doc1_lines, doc1_metadata = self._build_document_with_metadata(extraction1)
-        doc2_lines, doc2_metadata = self._build_document_with_metadata(extraction2)
-        
-        # Use difflib to find all differences
-        differ = difflib.Differ()
-        diff_result = list(differ.compare(doc1_lines, doc2_lines))
-        
-        # Parse diff results into structured differences
-        differences = self._parse_diff_results(
-            diff_result,
-            doc1_metadata,
-            doc2_metadata
+        # Identical content means identical lines, so there is nothing to diff
+        if self._fingerprint(extraction1) == self._fingerprint(extraction2):
+            return []
+        
+        # Build full text documents with line tracking. Both documents share
+        # one interner so identical lines map to the same integer id.
+        interner: dict[str, int] = {}
+        doc1_lines, doc1_ids, doc1_pages, doc1_titles = self._build_document_with_metadata(
+            extraction1, interner
         )
+        doc2_lines, doc2_ids, doc2_pages, doc2_titles = self._build_document_with_metadata(
+            extraction2, interner
+        )
+        doc1 = (doc1_lines, doc1_pages, doc1_titles)
+        doc2 = (doc2_lines, doc2_pages, doc2_titles)
+        
+        # Use difflib opcodes to find all differences in a single pass.
+        # Diffing integer ids avoids repeated string hashing and comparison.
+        matcher = difflib.SequenceMatcher(a=doc1_ids, b=doc2_ids, autojunk=False)
+        
+        differences = []
+        for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+            if tag == 'equal':  # Unchanged block
+                continue
+            
+            if tag == 'delete':  # Lines in doc1 but not doc2
+                for line in range(i1, i2):
+                    differences.append(self._removed(doc1, line))
+            
+            elif tag == 'insert':  # Lines in doc2 but not doc1
+                for line in range(j1, j2):
+                    differences.append(self._added(doc2, line))
+            
+            else:  # 'replace' - pair lines up to detect modifications
+                for doc1_line, doc2_line in zip(range(i1, i2), range(j1, j2)):
+                    original_text = doc1_lines[doc1_line]
+                    new_text = doc2_lines[doc2_line]
+                    
+                    if self._is_modification(original_text, new_text):
+                        differences.append(RawDifference(
+                            page_number=doc1_pages[doc1_line],
+                            section_title=doc1_titles[doc1_line],
+                            difference_type="modified",
+                            original_text=original_text,
+                            new_text=new_text,
+                            line_number=doc1_line
+                        ))
+                    else:
+                        differences.append(self._removed(doc1, doc1_line))
+                        differences.append(self._added(doc2, doc2_line))
+                
+                # Unpaired leftovers of an uneven replace block
+                paired = min(i2 - i1, j2 - j1)
+                for line in range(i1 + paired, i2):
+                    differences.append(self._removed(doc1, line))
+                for line in range(j1 + paired, j2):
+                    differences.append(self._added(doc2, line))
         
         return differences
     
+    def _fingerprint(self, extraction: PDFExtraction) -> bytes:
+        """Compute a content hash of an extraction for a cheap equality check.
+        
+        Args:
+            extraction: PDF extraction to fingerprint
+            
+        Returns:
+            Digest of all section contents, in order
+        """
+        hasher = _new_hasher()
+        for section in extraction.sections:
+            hasher.update(section.content.encode('utf-8'))
+            hasher.update(b'\n')
+        return hasher.digest()
+    
     def _build_document_with_metadata(
         self,
-        extraction: PDFExtraction
-    ) -> tuple[list[str], dict[int, tuple[int, str]]]:
+        extraction: PDFExtraction,
+        interner: dict[str, int]
+    ) -> tuple[list[str], list[int], list[int], list[str]]:
         """Build a line-by-line document with metadata tracking.
         
         Args:
             extraction: PDF extraction to process
+            interner: Shared mapping of line text to integer id (updated in place)
             
         Returns:
-            Tuple of (lines, metadata) where:
+            Tuple of (lines, ids, page_numbers, section_titles) as parallel lists:
             - lines: List of text lines
-            - metadata: Dict mapping line number to (page_number, section_title)
+            - ids: Integer id of each line, as assigned by the interner
+            - page_numbers: Page number of each line
+            - section_titles: Section title of each line
         """
         lines = []
-        metadata = {}
-        line_number = 0
+        ids = []
+        page_numbers = []
+        section_titles = []
         
         for section in extraction.sections:
-            # Split section content into lines
-            section_lines = section.content.split('\n')
+            # Split section content into non-empty, stripped lines
+            stripped_lines = [line.strip() for line in section.content.splitlines()]
+            stripped_lines = [line for line in stripped_lines if line]
+            count = len(stripped_lines)
             
-            for line in section_lines:
-                line = line.strip()
-                if line:  # Only include non-empty lines
-                    lines.append(line)
-                    metadata[line_number] = (section.page_number, section.section_title)
-                    line_number += 1
-        
-        return lines, metadata
+            lines.extend(stripped_lines)
+            ids.extend([interner.setdefault(line, len(interner)) for line in stripped_lines])
+            page_numbers.extend([section.page_number] * count)
+            section_titles.extend([section.section_title] * count)
+        
+        return lines, ids, page_numbers, section_titles
     
-    def _parse_diff_results(
-        self,
-        diff_result: list[str],
-        doc1_metadata: dict[int, tuple[int, str]],
-        doc2_metadata: dict[int, tuple[int, str]]
-    ) -> list[RawDifference]:
-        """Parse difflib results into RawDifference objects.
+    def _is_modification(self, original_text: str, new_text: str) -> bool:
+        """Check whether two lines are similar enough to count as a modification.
         
         Args:
-            diff_result: Output from difflib.Differ.compare()
-            doc1_metadata: Metadata for document 1
-            doc2_metadata: Metadata for document 2
+            original_text: Line from document 1
+            new_text: Line from document 2
             
         Returns:
-            List of RawDifference objects
+            True if the similarity ratio reaches the threshold
         """
-        differences = []
-        doc1_line = 0
-        doc2_line = 0
-        
-        i = 0
-        while i < len(diff_result):
-            line = diff_result[i]
-            
-            if line.startswith('  '):  # Unchanged line
-                doc1_line += 1
-                doc2_line += 1
-                i += 1
-                
-            elif line.startswith('- '):  # Line in doc1 but not doc2
-                original_text = line[2:].strip()
-                
-                # Check if next line is an addition (might be a modification)
-                if i + 1 < len(diff_result) and diff_result[i + 1].startswith('+ '):
-                    new_text = diff_result[i + 1][2:].strip()
-                    
-                    # Calculate similarity to determine if it's a modification
-                    similarity = difflib.SequenceMatcher(None, original_text, new_text).ratio()
-                    
-                    if similarity >= self.similarity_threshold:
-                        # Treat as modification
-                        page_num, section_title = doc1_metadata.get(doc1_line, (0, "Unknown"))
-                        differences.append(RawDifference(
-                            page_number=page_num,
-                            section_title=section_title,
-                            difference_type="modified",
-                            original_text=original_text,
-                            new_text=new_text,
-                            line_number=doc1_line
-                        ))
-                        doc1_line += 1
-                        doc2_line += 1
-                        i += 2  # Skip both lines
-                        continue
-                
-                # Otherwise, it's a removal
-                page_num, section_title = doc1_metadata.get(doc1_line, (0, "Unknown"))
-                differences.append(RawDifference(
-                    page_number=page_num,
-                    section_title=section_title,
-                    difference_type="removed",
-                    original_text=original_text,
-                    new_text="",
-                    line_number=doc1_line
-                ))
-                doc1_line += 1
-                i += 1
-                
-            elif line.startswith('+ '):  # Line in doc2 but not doc1
-                new_text = line[2:].strip()
-                page_num, section_title = doc2_metadata.get(doc2_line, (0, "Unknown"))
-                
-                differences.append(RawDifference(
-                    page_number=page_num,
-                    section_title=section_title,
-                    difference_type="added",
-                    original_text="",
-                    new_text=new_text,
-                    line_number=doc2_line
-                ))
-                doc2_line += 1
-                i += 1
-                
-            else:  # Diff marker line
-                i += 1
-        
-        return differences
+        # Normalized Indel (LCS-based) similarity in 0..100; score_cutoff lets
+        # rapidfuzz bail out early below the threshold (returns 0)
+        score = ratio(
+            original_text,
+            new_text,
+            score_cutoff=self.similarity_threshold * 100
+        )
+        return score / 100.0 >= self.similarity_threshold
+    
+    def _removed(
+        self,
+        document: tuple[list[str], list[int], list[str]],
+        line_number: int
+    ) -> RawDifference:
+        """Build a "removed" difference for a line of document 1."""
+        lines, page_numbers, section_titles = document
+        return RawDifference(
+            page_number=page_numbers[line_number],
+            section_title=section_titles[line_number],
+            difference_type="removed",
+            original_text=lines[line_number],
+            new_text="",
+            line_number=line_number
+        )
+    
+    def _added(
+        self,
+        document: tuple[list[str], list[int], list[str]],
+        line_number: int
+    ) -> RawDifference:
+        """Build an "added" difference for a line of document 2."""
+        lines, page_numbers, section_titles = document
+        return RawDifference(
+            page_number=page_numbers[line_number],
+            section_title=section_titles[line_number],
+            difference_type="added",
+            original_text="",
+            new_text=lines[line_number],
+            line_number=line_number
+        )
     
     def group_related_differences(
         self,
@@ -213,13 +248,16 @@ class TextDiffer:
         if not differences:
             return []
         
-        # Sort by line number
-        sorted_diffs = sorted(differences, key=lambda d: d.line_number)
+        # compare_extractions emits differences in diff order, which is usually
+        # already sorted by line number. Only sort when it is not: additions are
+        # numbered by document 2 lines, so the two numberings can drift apart.
+        if any(a.line_number > b.line_number for a, b in pairwise(differences)):
+            differences = sorted(differences, key=attrgetter('line_number'))
         
         groups = []
-        current_group = [sorted_diffs[0]]
+        current_group = [differences[0]]
         
-        for diff in sorted_diffs[1:]:
+        for diff in islice(differences, 1, None):
             # If this diff is close to the last one in current group, add it
             if diff.line_number - current_group[-1].line_number <= max_distance:
                 current_group.append(diff)
@@ -1,9 +1,10 @@
 """Data models for the PDF comparison workflow."""
+import sys
 from dataclasses import dataclass, field
 from typing import Literal
 
 
-@dataclass
+@dataclass(slots=True)
 class TextSection:
     """Represents a section of text from a PDF."""
     page_number: int
@@ -11,6 +12,10 @@ class TextSection:
     content: str
     order: int  # Order within the page
     
+    def __post_init__(self) -> None:
+        """Intern the title so repeated headings share one string object."""
+        self.section_title = sys.intern(self.section_title)
+    
     def to_dict(self) -> dict:
         """Convert to dictionary for JSON serialization."""
         return {
@@ -21,7 +26,7 @@ class TextSection:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class PDFExtraction:
     """Represents the complete extraction from a PDF document."""
     filename: str
@@ -37,7 +42,7 @@ class PDFExtraction:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class TextDifference:
     """Represents a difference found between two PDF documents."""
     page_number: int
@@ -46,20 +51,9 @@ class TextDifference:
     original_text: str
     new_text: str
     context: str = ""  # Surrounding text for context
-    
-    def to_dict(self) -> dict:
-        """Convert to dictionary for CSV/JSON export."""
-        return {
-            "page_number": self.page_number,
-            "section": self.section,
-            "difference_type": self.difference_type,
-            "original_text": self.original_text,
-            "new_text": self.new_text,
-            "context": self.context
-        }
 
 
-@dataclass
+@dataclass(slots=True)
 class ComparisonResult:
     """Complete comparison result between two PDFs."""
     pdf1_name: str
@@ -67,11 +61,15 @@ class ComparisonResult:
     differences: list[TextDifference] = field(default_factory=list)
     total_differences: int = 0
     
-    def to_dict(self) -> dict:
-        """Convert to dictionary for JSON serialization."""
+    def __json__(self) -> dict:
+        """Return a shallow mapping for JSON encoders.
+        
+        The differences are left as dataclass instances for the encoder to
+        serialize directly, so no intermediate dicts are built.
+        """
         return {
             "pdf1_name": self.pdf1_name,
             "pdf2_name": self.pdf2_name,
             "total_differences": self.total_differences,
-            "differences": [diff.to_dict() for diff in self.differences]
+            "differences": self.differences
         }
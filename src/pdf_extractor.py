@@ -1,5 +1,8 @@
 """PDF extraction utilities using multiple strategies."""
-import json
+import re
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 from pathlib import Path
 from typing import Any
 
@@ -7,22 +10,55 @@ import pdfplumber
 from azure.ai.documentintelligence import DocumentIntelligenceClient
 from azure.core.credentials import AzureKeyCredential
 
-from .config import AzureDocumentIntelligenceConfig
+from .config import PDF_TEXT_BACKENDS, AzureDocumentIntelligenceConfig
 from .models import PDFExtraction, TextSection
+from .serialization import write_json
+
+try:
+    import pypdfium2 as pdfium
+except ImportError:  # Optional native text backend, pdfplumber is used instead
+    pdfium = None
+
+# Guards every pdfium call; the library must not be used from two threads at once
+_PDFIUM_LOCK = threading.Lock()
+
+# Paragraph separator (blank line, possibly containing whitespace)
+_PARA_RE = re.compile(r'\n\s*\n')
+
+# Short first line (under 100 characters) followed by a body
+_HEADING_RE = re.compile(r'^([^\n]{1,99})\n(.*)$', re.DOTALL)
 
 
 class PDFExtractor:
     """Handles PDF extraction using various strategies."""
     
-    def __init__(self, doc_intel_config: AzureDocumentIntelligenceConfig | None = None):
+    def __init__(
+        self,
+        doc_intel_config: AzureDocumentIntelligenceConfig | None = None,
+        text_backend: str = "pypdfium2"
+    ):
         """Initialize PDF extractor.
         
         Args:
             doc_intel_config: Azure Document Intelligence configuration (optional)
+            text_backend: Local text backend, "pypdfium2" (fast) or "pdfplumber".
+                          Falls back to pdfplumber if pypdfium2 is not installed.
+            
+        Raises:
+            ValueError: If text_backend is not a supported backend name
         """
+        if text_backend not in PDF_TEXT_BACKENDS:
+            raise ValueError(f"Unsupported PDF text backend: {text_backend}")
+        
         self.doc_intel_config = doc_intel_config
+        self.text_backend = (
+            "pypdfium2" if text_backend == "pypdfium2" and pdfium is not None else "pdfplumber"
+        )
         self.doc_intel_client = None
         
+        # Extraction cache: (path, use_document_intelligence) -> ((mtime_ns, size), result)
+        self._cache: dict[tuple[str, bool], tuple[tuple[int, int], PDFExtraction]] = {}
+        
         if doc_intel_config:
             self.doc_intel_client = DocumentIntelligenceClient(
                 endpoint=doc_intel_config.endpoint,
@@ -30,10 +66,11 @@ class PDFExtractor:
             )
     
     def extract_with_pdfplumber(self, pdf_path: Path) -> PDFExtraction:
-        """Extract text from PDF using pdfplumber (simple, fast, local).
+        """Extract text from PDF locally (simple, fast, no API calls).
         
-        This method extracts text page by page and attempts to identify sections
-        based on formatting patterns.
+        Page text is read with the configured local backend (pypdfium2 by
+        default, pdfplumber as fallback) and split into sections based on
+        formatting patterns.
         
         Args:
             pdf_path: Path to the PDF file
@@ -41,46 +78,112 @@ class PDFExtractor:
         Returns:
             PDFExtraction: Structured extraction result
         """
-        sections = []
+        if self.text_backend == "pypdfium2":
+            pages = self._extract_text_fast(pdf_path)
+        else:
+            pages = self._extract_text_pdfplumber(pdf_path)
         
-        with pdfplumber.open(pdf_path) as pdf:
-            total_pages = len(pdf.pages)
-            
-            for page_num, page in enumerate(pdf.pages, start=1):
-                # Extract text from the page
-                text = page.extract_text()
-                
-                if not text:
-                    continue
-                
-                # Split into paragraphs (simple heuristic)
-                paragraphs = [p.strip() for p in text.split('\n\n') if p.strip()]
-                
-                # Create sections from paragraphs
-                for order, paragraph in enumerate(paragraphs, start=1):
-                    # Try to detect if first line is a heading (all caps, short, ends with specific chars)
-                    lines = paragraph.split('\n')
-                    if len(lines) > 1 and len(lines[0]) < 100:
-                        section_title = lines[0].strip()
-                        content = '\n'.join(lines[1:]).strip()
-                    else:
-                        section_title = f"Section {order}"
-                        content = paragraph
-                    
-                    if content:  # Only add non-empty sections
-                        sections.append(TextSection(
-                            page_number=page_num,
-                            section_title=section_title,
-                            content=content,
-                            order=order
-                        ))
+        sections = []
+        for page_num, text in pages:
+            if not text:
+                continue
+            
+            sections.extend(self._build_sections(page_num, text))
         
         return PDFExtraction(
             filename=pdf_path.name,
-            total_pages=total_pages,
+            total_pages=len(pages),
             sections=sections
         )
     
+    def _extract_text_fast(self, pdf_path: Path) -> list[tuple[int, str]]:
+        """Extract plain page text using the native pypdfium2 backend.
+        
+        Args:
+            pdf_path: Path to the PDF file
+            
+        Returns:
+            List of (page_number, text) tuples, one per page
+        """
+        pages = []
+        
+        # PDFium is not thread-safe, even across documents, so serialize all calls
+        with _PDFIUM_LOCK:
+            pdf = pdfium.PdfDocument(pdf_path)
+            try:
+                for index in range(len(pdf)):
+                    page = pdf[index]
+                    try:
+                        textpage = page.get_textpage()
+                        try:
+                            # pdfium uses CRLF line breaks; normalize for the paragraph heuristic
+                            text = textpage.get_text_range().replace('\r\n', '\n')
+                        finally:
+                            textpage.close()
+                    finally:
+                        page.close()
+                    pages.append((index + 1, text))
+            finally:
+                pdf.close()
+        
+        return pages
+    
+    def _extract_text_pdfplumber(self, pdf_path: Path) -> list[tuple[int, str]]:
+        """Extract page text using pdfplumber's layout model.
+        
+        Args:
+            pdf_path: Path to the PDF file
+            
+        Returns:
+            List of (page_number, text) tuples, one per page
+        """
+        with pdfplumber.open(pdf_path) as pdf:
+            return [
+                (page_num, page.extract_text() or "")
+                for page_num, page in enumerate(pdf.pages, start=1)
+            ]
+    
+    def _build_sections(self, page_num: int, text: str) -> list[TextSection]:
+        """Split the text of a page into sections.
+        
+        Paragraphs are separated by blank lines. If a paragraph has more than
+        one line and its first line is short, that line is used as the heading.
+        
+        Args:
+            page_num: Page number the text belongs to
+            text: Extracted text of the page
+            
+        Returns:
+            List of non-empty sections in page order
+        """
+        sections = []
+        order = 0
+        
+        for paragraph in _PARA_RE.split(text):
+            paragraph = paragraph.strip()
+            if not paragraph:
+                continue
+            order += 1
+            
+            # Try to detect if first line is a heading (short line followed by body)
+            match = _HEADING_RE.match(paragraph)
+            if match:
+                section_title = match.group(1).strip()
+                content = match.group(2).strip()
+            else:
+                section_title = f"Section {order}"
+                content = paragraph
+            
+            if content:  # Only add non-empty sections
+                sections.append(TextSection(
+                    page_number=page_num,
+                    section_title=section_title,
+                    content=content,
+                    order=order
+                ))
+        
+        return sections
+    
     def extract_with_document_intelligence(self, pdf_path: Path) -> PDFExtraction:
         """Extract text from PDF using Azure Document Intelligence (advanced).
         
@@ -140,6 +243,12 @@ class PDFExtractor:
     def extract(self, pdf_path: Path, use_document_intelligence: bool = False) -> PDFExtraction:
         """Extract text from PDF using the best available method.
         
+        Results are cached on this extractor per file path, modification time
+        and size, so re-extracting an unchanged PDF (e.g. a reference document
+        compared repeatedly) returns the previous result. Each call gets its
+        own PDFExtraction with its own sections list; the TextSection objects
+        themselves are shared and should not be modified.
+        
         Args:
             pdf_path: Path to the PDF file
             use_document_intelligence: Force use of Azure Document Intelligence
@@ -147,13 +256,80 @@ class PDFExtractor:
         Returns:
             PDFExtraction: Structured extraction result
         """
-        if use_document_intelligence and self.doc_intel_client:
+        stat = pdf_path.stat()
+        use_document_intelligence = bool(use_document_intelligence and self.doc_intel_client)
+        
+        # One entry per file and strategy; a changed mtime or size replaces it
+        key = (str(pdf_path), use_document_intelligence)
+        file_id = (stat.st_mtime_ns, stat.st_size)
+        cached = self._cache.get(key)
+        if cached is None or cached[0] != file_id:
+            cached = (file_id, self._extract_uncached(pdf_path, use_document_intelligence))
+            self._cache[key] = cached
+        
+        # Shallow copy so callers cannot change the cached sections list
+        return _copy_extraction(cached[1])
+    
+    def _extract_uncached(self, pdf_path: Path, use_document_intelligence: bool) -> PDFExtraction:
+        """Extract text from PDF without consulting the cache.
+        
+        Args:
+            pdf_path: Path to the PDF file
+            use_document_intelligence: Use Azure Document Intelligence
+            
+        Returns:
+            PDFExtraction: Structured extraction result
+        """
+        if use_document_intelligence:
             print(f"Extracting {pdf_path.name} using Azure Document Intelligence...")
             return self.extract_with_document_intelligence(pdf_path)
         else:
-            print(f"Extracting {pdf_path.name} using pdfplumber...")
+            print(f"Extracting {pdf_path.name} using {self.text_backend}...")
             return self.extract_with_pdfplumber(pdf_path)
     
+    def extract_many(
+        self,
+        pdf_paths: list[Path],
+        max_workers: int | None = None
+    ) -> list[PDFExtraction]:
+        """Extract many PDFs locally in parallel worker processes.
+        
+        Library API for batch callers (e.g. comparing a whole folder); the
+        command-line app extracts its two files through extract(). Files not
+        already in this extractor's cache are processed with the local text
+        backend in separate processes, so extraction is not limited by the
+        GIL, and the results are added to the cache. Azure Document
+        Intelligence is not used here.
+        
+        Args:
+            pdf_paths: Paths to the PDF files
+            max_workers: Number of worker processes (None uses the CPU count)
+            
+        Returns:
+            List of extraction results in the same order as pdf_paths
+        """
+        # Collect files that are missing from the cache or changed since
+        misses: dict[str, tuple[Path, tuple[int, int]]] = {}
+        for pdf_path in pdf_paths:
+            stat = pdf_path.stat()
+            file_id = (stat.st_mtime_ns, stat.st_size)
+            cached = self._cache.get((str(pdf_path), False))
+            if cached is None or cached[0] != file_id:
+                misses[str(pdf_path)] = (pdf_path, file_id)
+        
+        if misses:
+            print(f"Extracting {len(misses)} PDFs using {self.text_backend} in parallel...")
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                extractions = executor.map(
+                    _extract_local,
+                    [pdf_path for pdf_path, _ in misses.values()],
+                    repeat(self.text_backend)
+                )
+                for (key, (_, file_id)), extraction in zip(misses.items(), extractions):
+                    self._cache[(key, False)] = (file_id, extraction)
+        
+        return [_copy_extraction(self._cache[(str(pdf_path), False)][1]) for pdf_path in pdf_paths]
+    
     def save_extraction(self, extraction: PDFExtraction, output_path: Path) -> None:
         """Save extraction result to JSON file.
         
@@ -161,7 +337,35 @@ class PDFExtractor:
             extraction: The extraction result to save
             output_path: Path where to save the JSON file
         """
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(extraction.to_dict(), f, indent=2, ensure_ascii=False)
+        write_json(extraction.to_dict(), output_path)
         
         print(f"Saved extraction to {output_path}")
+
+
+def _extract_local(pdf_path: Path, text_backend: str) -> PDFExtraction:
+    """Extract a PDF with the local text backend (picklable process pool entry point).
+    
+    Args:
+        pdf_path: Path to the PDF file
+        text_backend: Local text backend name
+        
+    Returns:
+        PDFExtraction: Structured extraction result
+    """
+    return PDFExtractor(text_backend=text_backend).extract_with_pdfplumber(pdf_path)
+
+
+def _copy_extraction(extraction: PDFExtraction) -> PDFExtraction:
+    """Shallow-copy an extraction with its own sections list.
+    
+    Args:
+        extraction: Cached extraction result
+        
+    Returns:
+        PDFExtraction: Copy sharing the (unmodified) TextSection objects
+    """
+    return PDFExtraction(
+        filename=extraction.filename,
+        total_pages=extraction.total_pages,
+        sections=list(extraction.sections)
+    )
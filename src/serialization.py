@@ -0,0 +1,46 @@
+"""JSON serialization helpers for extraction and comparison outputs."""
+import json
+from dataclasses import fields, is_dataclass
+from pathlib import Path
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # Optional fast encoder, the stdlib json module is used instead
+    orjson = None
+
+# Write buffer size for result files (1 MiB)
+WRITE_BUFFER_SIZE = 1 << 20
+
+
+class _Encoder(json.JSONEncoder):
+    """JSON encoder for objects with a __json__ method and (slotted) dataclasses."""
+    
+    def default(self, o: Any) -> Any:
+        if hasattr(o, '__json__'):
+            return o.__json__()
+        if is_dataclass(o):
+            return {f.name: getattr(o, f.name) for f in fields(o)}
+        return super().default(o)
+
+
+def write_json(data: Any, output_path: Path) -> None:
+    """Write data as indented UTF-8 JSON.
+    
+    Objects providing a __json__ method are serialized from the mapping it
+    returns. Uses orjson when installed, which also serializes dataclasses
+    natively. Otherwise falls back to json.dump with a custom encoder.
+    
+    Args:
+        data: JSON-serializable data (dicts, lists, dataclass instances)
+        output_path: Path of the JSON file to write
+    """
+    if orjson is not None:
+        if hasattr(data, '__json__'):
+            data = data.__json__()
+        with open(output_path, 'wb', buffering=WRITE_BUFFER_SIZE) as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+        return
+    
+    with open(output_path, 'w', encoding='utf-8', buffering=WRITE_BUFFER_SIZE) as f:
+        json.dump(data, f, cls=_Encoder, indent=2, ensure_ascii=False)
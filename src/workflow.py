@@ -1,6 +1,5 @@
 """Workflow orchestration for PDF comparison using Microsoft Agent Framework."""
 import csv
-import json
 from pathlib import Path
 
 from agent_framework import WorkflowBuilder
@@ -11,10 +10,26 @@ from .agents import PDFComparisonAgent, PDFExtractionAgent
 from .config import AppConfig
 from .models import ComparisonResult
 from .pdf_extractor import PDFExtractor
+from .serialization import WRITE_BUFFER_SIZE, write_json
+
+# Column order of the CSV export
+CSV_FIELDNAMES = (
+    "page_number",
+    "section",
+    "difference_type",
+    "original_text",
+    "new_text",
+    "context"
+)
 
 
 class PDFComparisonWorkflow:
-    """Orchestrates the multi-agent PDF comparison workflow."""
+    """Orchestrates the multi-agent PDF comparison workflow.
+    
+    Each instance owns its chat client and PDF extractor. To benefit from the
+    extractor's cache (e.g. comparing one reference PDF against many others),
+    reuse a single instance for all comparisons within one event loop.
+    """
     
     def __init__(self, config: AppConfig):
         """Initialize the workflow with configuration.
@@ -24,7 +39,9 @@ class PDFComparisonWorkflow:
         """
         self.config = config
         
-        # Initialize Azure OpenAI chat client with temperature=0.0 for deterministic results
+        # Initialize Azure OpenAI chat client with temperature=0.0 for deterministic results.
+        # The client is tied to the event loop it first runs on, so it is not shared
+        # between instances; reuse the workflow instance to reuse the client.
         self.chat_client = AzureOpenAIChatClient(
             endpoint=config.azure_openai.endpoint,
             credential=AzureKeyCredential(config.azure_openai.api_key),
@@ -34,7 +51,10 @@ class PDFComparisonWorkflow:
         )
         
         # Initialize PDF extractor
-        self.pdf_extractor = PDFExtractor(config.azure_document_intelligence)
+        self.pdf_extractor = PDFExtractor(
+            config.azure_document_intelligence,
+            text_backend=config.pdf_text_backend
+        )
         
         # Create the agents
         self.extraction_agent = PDFExtractionAgent(
@@ -93,30 +113,28 @@ class PDFComparisonWorkflow:
         """
         output_folder = self.config.output_folder
         
-        # Save as JSON
+        # Save as JSON (serialized via ComparisonResult.__json__)
         json_path = output_folder / "comparison_results.json"
-        with open(json_path, 'w', encoding='utf-8') as f:
-            json.dump(result.to_dict(), f, indent=2, ensure_ascii=False)
+        write_json(result, json_path)
         
         print(f"\n✓ Saved JSON results to {json_path}")
         
         # Save as CSV for easy viewing in spreadsheet applications
         csv_path = output_folder / "comparison_results.csv"
-        with open(csv_path, 'w', encoding='utf-8', newline='') as f:
-            writer = csv.DictWriter(
-                f,
-                fieldnames=[
-                    "page_number",
-                    "section",
-                    "difference_type",
-                    "original_text",
-                    "new_text",
-                    "context"
-                ]
+        with open(csv_path, 'w', encoding='utf-8', newline='', buffering=WRITE_BUFFER_SIZE) as f:
+            writer = csv.writer(f)
+            writer.writerow(CSV_FIELDNAMES)
+            writer.writerows(
+                (
+                    diff.page_number,
+                    diff.section,
+                    diff.difference_type,
+                    diff.original_text,
+                    diff.new_text,
+                    diff.context
+                )
+                for diff in result.differences
             )
-            writer.writeheader()
-            for diff in result.differences:
-                writer.writerow(diff.to_dict())
         
         print(f"✓ Saved CSV results to {csv_path}")
         